@@ -5,17 +5,45 @@ Fetches recent papers with 'numerical relativity' keywords and generates an HTML
 """
 
 import requests
-import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+try:
+    from lxml import etree as ET  # C parser, much faster than the stdlib one
+    # Only report <entry> elements, and never expand entities or fetch
+    # anything referenced by the feed
+    ITERPARSE_OPTIONS = {'tag': '{http://www.w3.org/2005/Atom}entry',
+                         'resolve_entities': False, 'no_network': True}
+except ImportError:
+    import xml.etree.ElementTree as ET
+    ITERPARSE_OPTIONS = {}
 from datetime import datetime, timedelta
 import re
+import io
 import argparse
 import os
 import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from html import escape
+from operator import itemgetter
+from itertools import zip_longest
 
 # Configuration
 DATABASE = "papers.json"
 HTML_OUTPUT = "index.html"
 NBR_AUTHORS_TO_DISPLAY = 7
+MAX_CONCURRENT_QUERIES = 4  # arXiv queries allowed in flight at once
+API_REQUEST_INTERVAL = 3  # seconds between starting arXiv requests, as asked by arXiv
+PAGE_SIZE = 100  # entries requested per arXiv API call
+MAX_RETRIES = 3  # extra attempts for a page after a transient error
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_RESULTS = 2000  # hard cap on entries fetched for a single query
+MAX_COMBINED_QUERY_LENGTH = 1800  # encoded search_query bytes per request, keeping the full URL under 2 KB
+QUERY_CACHE_DIR = ".arxiv_cache"  # parsed arXiv query results, per query and day
+QUERY_CACHE_TTL = 3600  # seconds before a cached query is fetched again
+SEPARATOR = "=" * 60  # between the steps of a run in the console output
 
 # Add author names here to automatically include their papers
 # UKNR authors that haven't used "numerical relativity" 
@@ -28,12 +56,27 @@ TARGET_AUTHORS = [
     "Eugene A. Lim"
 ]
 
-def search_arxiv(query: str, days_back: int = 30, target_authors: list = None) -> list:
+# Atom feed tags in Clark notation, so find() needs no namespace lookups
+ATOM = '{http://www.w3.org/2005/Atom}'
+ATOM_ENTRY = ATOM + 'entry'
+ATOM_TITLE = ATOM + 'title'
+ATOM_AUTHOR = ATOM + 'author'
+ATOM_NAME = ATOM + 'name'
+ATOM_SUMMARY = ATOM + 'summary'
+ATOM_ID = ATOM + 'id'
+ATOM_PUBLISHED = ATOM + 'published'
+ATOM_UPDATED = ATOM + 'updated'
+ATOM_CATEGORY = ATOM + 'category'
+
+# arXiv timestamps are fixed-width UTC, so they compare correctly as strings
+ARXIV_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+def search_arxiv(query: str | list, days_back: int = 30, target_authors: list = None) -> list:
     """
     Search arXiv for papers matching the query or from specific authors.
     
     Args:
-        query: Search query string
+        query: Search query string, or a list of them to match any of
         days_back: How many days back to search
         target_authors: List of author names to search for (optional)
         
@@ -45,136 +88,336 @@ def search_arxiv(query: str, days_back: int = 30, target_authors: list = None) -
     start_date = end_date - timedelta(days=days_back)
     
     # Search for keyword-based papers
-    search_query = f'all:"{query}"'
-    print(f"Searching arXiv for: {query}")
-    print(f"  -> Keyword query: {search_query} | days_back={days_back}")
-    keyword_papers = fetch_papers_from_query(search_query, start_date)
-    print(f"  -> Keyword query returned {len(keyword_papers)} papers before filtering")
-    
-    # Remove duplicates
-    all_papers = []
-    seen_arxiv_ids = set()
-    for paper in keyword_papers:
-        if paper['arxiv_id'] not in seen_arxiv_ids:
-            all_papers.append(paper)
-            seen_arxiv_ids.add(paper['arxiv_id'])
-        else:
-            print(f"    Skipping duplicate keyword result: {paper['arxiv_id']}")
-    print(f"Found {len(all_papers)} unique papers from the last {days_back} days")
+    keywords = [query] if isinstance(query, str) else query
+    keyword_queries = [f'all:"{keyword}"' for keyword in keywords]
+    print(f"Searching arXiv for: {', '.join(keywords)}")
+    for keyword_query in keyword_queries:
+        print(f"  -> Keyword query: {keyword_query} | days_back={days_back}")
     
-    # Search for papers by specific authors if provided
+    author_queries = [f'au:"{author}"' for author in target_authors or []]
     if target_authors:
         print(f"Also searching for papers by specific authors: {', '.join(target_authors)}")
-        for author in target_authors:
-            author_query = f'au:"{author}"'
-            print(f"  - Searching for papers by: {author}")
+        for author_query in author_queries:
             print(f"    -> Author query: {author_query}")
-            author_papers = fetch_papers_from_query(author_query, start_date)
-            print(f"    -> Author query returned {len(author_papers)} papers before filtering")
-            
-            # Include if not duplicate
-            for paper in author_papers:
-                if paper['arxiv_id'] not in seen_arxiv_ids:
-                    all_papers.append(paper)
-                    seen_arxiv_ids.add(paper['arxiv_id'])
-                else:
-                    print(f"      Skipping duplicate author result: {paper['arxiv_id']}")
+    
+    # Let arXiv filter on submission date, so older papers are never downloaded.
+    # Whole days keep the query (and its cache entry) the same for a day
+    date_clause = f'submittedDate:[{start_date:%Y%m%d}0000 TO {end_date:%Y%m%d}2359]'
+    
+    # OR the queries together so they need as few round trips as possible,
+    # splitting into groups where one URL would get too long. The length is
+    # measured as sent: URL-encoded and including the date clause
+    groups = [[]]
+    for q in keyword_queries + author_queries:
+        candidate = ' OR '.join(f'({g})' for g in groups[-1] + [q])
+        if groups[-1] and len(urlencode({'search_query': f'({candidate}) AND {date_clause}'})) > MAX_COMBINED_QUERY_LENGTH:
+            groups.append([])
+        groups[-1].append(q)
+    combined_queries = [' OR '.join(f'({q})' for q in group) for group in groups]
+    for combined_query in combined_queries:
+        print(f"  -> Combined query: {combined_query}")
+    
+    # Run the grouped queries concurrently, results come back in the order submitted
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_QUERIES) as executor:
+        results = list(executor.map(
+            lambda combined_query: fetch_papers_from_query(f'({combined_query}) AND {date_clause}', start_date),
+            combined_queries))
+    
+    # Remove duplicates in one pass, keeping the most recently updated version
+    merged = {}
+    for papers in results:
+        print(f"  -> Query returned {len(papers)} papers before filtering")
+        for paper in papers:
+            arXiv_id = arxiv_base_id(paper['arxiv_id'])
+            previous = merged.get(arXiv_id)
+            if previous is None or paper['updated'] > previous['updated']:
+                merged[arXiv_id] = paper
+    all_papers = list(merged.values())
     
     # Sort all papers by publication date (newest first)
-    all_papers.sort(key=lambda p: p['published'], reverse=True)
+    all_papers.sort(key=itemgetter('published'), reverse=True)
     
     print(f"Found {len(all_papers)} unique papers from the last {days_back} days")
     return all_papers
 
-def fetch_papers_from_query(query: str, start_date: datetime) -> list:
+# Version suffix of an arXiv ID, e.g. the 'v2' in '2602.14898v2'
+VERSION_SUFFIX_RE = re.compile(r'v\d+$')
+
+def arxiv_base_id(arxiv_id: str) -> str:
+    """
+    Strip the version suffix from an arXiv ID, so that different versions
+    of the same paper are recognised as duplicates.
+    
+    Args:
+        arxiv_id: arXiv ID, e.g. '2602.14898v2'
+        
+    Returns:
+        arXiv ID without version, e.g. '2602.14898'
+    """
+    return VERSION_SUFFIX_RE.sub('', arxiv_id)
+
+# One session for all arXiv queries, so connections are reused between requests.
+# Retries are done in request_arxiv_page rather than by the adapter, so that
+# every attempt waits for its API slot
+session = requests.Session()
+session.headers.update({'User-Agent': 'UKNR_papers arXiv scraper (+https://github.com/robynlm/UKNR_papers)'})
+pool_adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_QUERIES, pool_maxsize=MAX_CONCURRENT_QUERIES)
+session.mount('http://', pool_adapter)
+session.mount('https://', pool_adapter)
+
+api_request_lock = threading.Lock()
+last_api_request = 0.0
+
+def wait_for_api_slot():
+    """
+    Block until API_REQUEST_INTERVAL seconds have passed since the last
+    arXiv request was started, so concurrent queries stay within arXiv's limits.
+    """
+    global last_api_request
+    with api_request_lock:
+        delay = last_api_request + API_REQUEST_INTERVAL - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        last_api_request = time.monotonic()
+
+def parse_arxiv_date(timestamp: str) -> datetime:
+    """
+    Parse an arXiv timestamp such as '2026-02-14T18:59:59Z'.
+    
+    Args:
+        timestamp: ISO 8601 timestamp in UTC
+        
+    Returns:
+        Naive datetime in UTC
+    """
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1]
+    return datetime.fromisoformat(timestamp).replace(tzinfo=None)
+
+def query_cache_path(query: str, start_date: datetime) -> str:
     """
-    Fetch papers from arXiv API for a given query.
+    Path of the on-disk cache file for a query and start day.
     
     Args:
         query: Search query string
         start_date: Earliest date to include papers from
+        
+    Returns:
+        Path of the JSON cache file
+    """
+    key = hashlib.sha1(f"{query}|{start_date:%Y-%m-%d}".encode('utf-8')).hexdigest()
+    return os.path.join(QUERY_CACHE_DIR, f"{key}.json")
+
+def load_cached_query(query: str, start_date: datetime):
+    """
+    Load the cached results of a query if they are recent enough.
     
+    Args:
+        query: Search query string
+        start_date: Earliest date to include papers from
+        
     Returns:
-        List of Paper dictionaries with keys
+        List of Paper dictionaries, or None if there is no fresh cache entry
     """
-    print(f"    -> Requesting arXiv API with query: {query}")
+    if QUERY_CACHE_TTL <= 0:
+        return None
+    
+    cache_file = query_cache_path(query, start_date)
+    try:
+        if time.time() - os.path.getmtime(cache_file) > QUERY_CACHE_TTL:
+            return None
+    except FileNotFoundError:
+        return None
+    
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            papers = json.load(f)
+    except Exception as e:
+        print(f"Error loading query cache: {e}")
+        return None
+    
+    # The cache is per day, so drop papers older than this run's exact cutoff
+    cutoff = start_date.strftime(ARXIV_DATE_FORMAT)
+    return [paper for paper in papers if paper['published'] >= cutoff]
 
-    # arXiv API URL
-    base_url = "http://export.arxiv.org/api/query"
-    params = {
-        'search_query': query,
-        'start': 0,
-        'sortBy': 'submittedDate',
-        'sortOrder': 'descending'
-    }
+def save_cached_query(query: str, start_date: datetime, papers: list):
+    """
+    Save the results of a query to the on-disk cache.
+    
+    Args:
+        query: Search query string
+        start_date: Earliest date to include papers from
+        papers: List of Paper dictionaries
+    """
+    # A zero TTL disables the cache, so nothing is written that could never be read
+    if QUERY_CACHE_TTL <= 0:
+        return
+    
     try:
-        response = requests.get(base_url, params=params, timeout=30)
-        print(f"       HTTP {response.status_code} | {len(response.content)} bytes")
-        response.raise_for_status()
-    except requests.RequestException as e:
-        print(f"Error fetching data from arXiv: {e}")
-        return []
+        os.makedirs(QUERY_CACHE_DIR, exist_ok=True)
+        with open(query_cache_path(query, start_date), 'w', encoding='utf-8') as f:
+            json.dump(papers, f, ensure_ascii=False)
+    except Exception as e:
+        print(f"Error saving query cache: {e}")
+
+def parse_arxiv_feed(content: bytes, start_date: datetime):
+    """
+    Parse one page of an arXiv Atom feed, one <entry> at a time.
+    
+    Args:
+        content: Raw XML of the API response
+        start_date: Earliest date to include papers from
+        
+    Returns:
+        Tuple of (Paper dictionaries, number of entries read, whether an
+        entry older than start_date was reached), or None if the XML is invalid
+    """
+    papers = []
+    nbr_entries = 0
+    reached_cutoff = False
+    cutoff = start_date.strftime(ARXIV_DATE_FORMAT)
     
-    # Parse XML response to string
     try:
-        root = ET.fromstring(response.content)
-        print("       XML parsed successfully")
+        for _, entry in ET.iterparse(io.BytesIO(content), events=('end',), **ITERPARSE_OPTIONS):
+            if entry.tag != ATOM_ENTRY:
+                continue
+            nbr_entries += 1
+            try:
+                # Extract arXiv ID and date first, so entries past the cutoff
+                # are not parsed any further
+                arxiv_id = entry.findtext(ATOM_ID).split('/')[-1]
+                published = entry.findtext(ATOM_PUBLISHED)
+                
+                # The query only covers whole days, so trim to the exact cutoff.
+                # Results are sorted by submission date, so the rest are older too
+                if published < cutoff:
+                    print(f"       Stopping at {arxiv_id} published {published} (older than cutoff {cutoff})")
+                    reached_cutoff = True
+                    break
+                
+                paper = {}
+
+                # Extract basic info
+                paper['title'] = ' '.join(entry.findtext(ATOM_TITLE).split())  # Clean whitespace
+                
+                # Extract authors
+                paper['authors'] = [author.findtext(ATOM_NAME)
+                                    for author in entry.findall(ATOM_AUTHOR)]
+                
+                # Extract abstract
+                paper['abstract'] = ' '.join(entry.findtext(ATOM_SUMMARY).split())  # Clean whitespace
+                
+                paper['arxiv_id'] = arxiv_id
+                
+                # Extract dates
+                paper['published'] = published
+                paper['updated'] = entry.findtext(ATOM_UPDATED, published)
+                
+                # Extract categories
+                paper['categories'] = [category.get('term')
+                                       for category in entry.findall(ATOM_CATEGORY)]
+                
+                papers.append(paper)
+                
+            except (AttributeError, ValueError, TypeError) as e:
+                # A required field is missing or malformed
+                print(f"Error processing entry: {e}")
+                continue
+            finally:
+                # Free the entry's subtree once processed, and with lxml also
+                # drop the cleared entries still attached to <feed>
+                entry.clear()
+                if hasattr(entry, 'getprevious'):
+                    while entry.getprevious() is not None:
+                        del entry.getparent()[0]
     except ET.ParseError as e:
         print(f"Error parsing XML response: {e}")
-        return []
-    
-    # Extract papers
-    papers = []
-    namespace = {'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'}
+        return None
     
-    entries = root.findall('atom:entry', namespace)
-    print(f"       Found {len(entries)} <entry> elements in feed")
+    print(f"       XML parsed successfully, read {nbr_entries} <entry> elements")
+    return papers, nbr_entries, reached_cutoff
+
+def request_arxiv_page(url: str, params: dict):
+    """
+    Request one page of arXiv results, retrying transient errors. Every
+    attempt, retries included, waits for an API slot first.
     
-    for entry in entries:
+    Args:
+        url: arXiv API URL
+        params: Query parameters for the request
+        
+    Returns:
+        Successful response, or None if the request failed
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        retries_left = attempt < MAX_RETRIES
         try:
-            paper = {}
-
-            # Extract basic info
-            paper['title'] = entry.find('atom:title', namespace).text
-            paper['title'] = re.sub(r'\s+', ' ', paper['title'])  # Clean whitespace
-            
-            # Extract authors
-            paper['authors'] = []
-            for author in entry.findall('atom:author', namespace):
-                name = author.find('atom:name', namespace).text
-                paper['authors'].append(name)
-            
-            # Extract abstract
-            paper['abstract'] = entry.find('atom:summary', namespace).text
-            paper['abstract'] = re.sub(r'\s+', ' ', paper['abstract'])  # Clean whitespace
-            
-            # Extract arXiv ID
-            paper['arxiv_id'] = entry.find('atom:id', namespace).text.split('/')[-1]
-            
-            # Extract dates
-            paper['published'] = entry.find('atom:published', namespace).text
-            updated_elem = entry.find('atom:updated', namespace)
-            paper['updated'] = updated_elem.text if updated_elem is not None else paper['published']
-            
-            # Extract categories
-            paper['categories'] = []
-            for category in entry.findall('atom:category', namespace):
-                paper['categories'].append(category.get('term'))
-            
-            # Check if paper is within date range
-            published_date = datetime.fromisoformat(
-                paper['published'].replace('Z', '+00:00')).replace(tzinfo=None)
-            if published_date >= start_date:
-                papers.append(paper)
-            else:
-                print(f"       Skipping {paper['arxiv_id']} published {published_date} (older than cutoff {start_date})")
-            
-        except Exception as e:
-            print(f"Error processing entry: {e}")
-            continue
+            wait_for_api_slot()
+            response = session.get(url, params=params, timeout=30)
+            print(f"       HTTP {response.status_code} | {len(response.content)} bytes | start={params['start']}")
+            if response.status_code in RETRY_STATUS_CODES and retries_left:
+                print(f"       Retrying ({attempt + 1}/{MAX_RETRIES})")
+                continue
+            response.raise_for_status()
+            return response
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if not retries_left:
+                print(f"Error fetching data from arXiv: {e}")
+                return None
+            print(f"       {e}, retrying ({attempt + 1}/{MAX_RETRIES})")
+        except requests.RequestException as e:
+            print(f"Error fetching data from arXiv: {e}")
+            return None
+
+def fetch_papers_from_query(query: str, start_date: datetime,
+                            max_results: int = MAX_RESULTS) -> list:
+    """
+    Fetch papers from arXiv API for a given query, one page at a time until
+    papers older than start_date are reached.
+    
+    Args:
+        query: Search query string
+        start_date: Earliest date to include papers from
+        max_results: Maximum number of entries to request over all pages
+    
+    Returns:
+        List of Paper dictionaries with keys
+    """
+    papers = load_cached_query(query, start_date)
+    if papers is not None:
+        print(f"    -> Using {len(papers)} cached papers for query: {query}")
+        return papers
+    
+    print(f"    -> Requesting arXiv API with query: {query}")
+
+    # arXiv API URL
+    base_url = "https://export.arxiv.org/api/query"
+    papers = []
+    for start in range(0, max_results, PAGE_SIZE):
+        params = {
+            'search_query': query,
+            'start': start,
+            'max_results': min(PAGE_SIZE, max_results - start),
+            'sortBy': 'submittedDate',
+            'sortOrder': 'descending'
+        }
+        response = request_arxiv_page(base_url, params)
+        if response is None:
+            # Keep earlier pages, but don't cache an incomplete result
+            return papers
+        
+        page = parse_arxiv_feed(response.content, start_date)
+        if page is None:
+            return papers
+        page_papers, nbr_entries, reached_cutoff = page
+        papers.extend(page_papers)
+        
+        # Stop at the date cutoff, or when arXiv has no more results
+        if reached_cutoff or nbr_entries < params['max_results']:
+            break
     
     print(f"       Returning {len(papers)} papers after date filtering")
+    save_cached_query(query, start_date, papers)
     return papers
 
 def load_papers_database() -> list:
@@ -184,15 +427,14 @@ def load_papers_database() -> list:
     Returns:
         List of dictionary objects
     """
-    if not os.path.exists(DATABASE):
-        print(f"Database file {DATABASE} not found, starting fresh")
-        return []
-    
     try:
         with open(DATABASE, 'r', encoding='utf-8') as f:
             papers = json.load(f)
         print(f"Loaded {len(papers)} papers from database")
         return papers
+    except FileNotFoundError:
+        print(f"Database file {DATABASE} not found, starting fresh")
+        return []
     except Exception as e:
         print(f"Error loading database: {e}")
         return []
@@ -209,18 +451,22 @@ def merge_papers(existing_papers: list, new_papers: list) -> list:
         Merged list of papers
     """
 
-    papers_dict = {paper['arxiv_id']: paper for paper in existing_papers}
-    seen_arxiv_ids = set(papers_dict.keys())
+    # Key on the version-less ID so v1/v2 of a paper collapse to the newest
+    papers_dict = {}
+    for paper in existing_papers:
+        arXiv_id = arxiv_base_id(paper['arxiv_id'])
+        if (arXiv_id not in papers_dict
+                or paper['updated'] > papers_dict[arXiv_id]['updated']):
+            papers_dict[arXiv_id] = paper
 
     nbr_new = 0
     nbr_updated = 0
     for paper in new_papers:
-        arXiv_id = paper['arxiv_id']
+        arXiv_id = arxiv_base_id(paper['arxiv_id'])
 
-        if arXiv_id not in seen_arxiv_ids:
+        if arXiv_id not in papers_dict:
             # Include new paper if it's not already in the database
             papers_dict[arXiv_id] = paper
-            seen_arxiv_ids.add(arXiv_id)
             nbr_new += 1
         
         elif paper['updated'] > papers_dict[arXiv_id]['updated']:
@@ -232,7 +478,7 @@ def merge_papers(existing_papers: list, new_papers: list) -> list:
     
     # Convert back to list and sort by publication date
     merged_papers = list(papers_dict.values())
-    merged_papers.sort(key=lambda p: p['published'], reverse=True)
+    merged_papers.sort(key=itemgetter('published'), reverse=True)
     
     return merged_papers
 
@@ -247,14 +493,12 @@ def prune_old_papers(papers: list, max_age_days: int = 90) -> list:
     Returns:
         List of papers within the age limit
     """
-    cutoff_date = datetime.now() - timedelta(days=max_age_days)
+    cutoff_date = (datetime.now() - timedelta(days=max_age_days)).strftime(ARXIV_DATE_FORMAT)
     pruned_papers = []
     removed_count = 0
     
     for paper in papers:
-        published_date = datetime.fromisoformat(
-            paper['published'].replace('Z', '+00:00')).replace(tzinfo=None)
-        if published_date >= cutoff_date:
+        if paper['published'] >= cutoff_date:
             pruned_papers.append(paper)
         else:
             removed_count += 1
@@ -273,311 +517,28 @@ def save_papers_database(papers: list):
     """
     try:
         data = papers  # papers are now dictionaries
-        with open(DATABASE, 'w', encoding='utf-8') as f:
+        # Write next to the database and move into place, so an interrupted
+        # save never leaves a truncated papers.json
+        temp_database = DATABASE + '.tmp'
+        with open(temp_database, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_database, DATABASE)
         print(f"Saved {len(papers)} papers to database")
     except Exception as e:
         print(f"Error saving database: {e}")
 
-def generate_html(papers: list):
-    """
-    Generate HTML page with the papers.
-    
-    Args:
-        papers: List of dictionary objects
-    """
-    # Get current timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    
-    html_content = f"""<!DOCTYPE html>
+# HTML templates used by generate_html. HTML_HEADER and HTML_PAPER are filled
+# in with str.format. The page styles live in style.css and the abstract toggles
+# in papers.js, both served next to index.html
+HTML_HEADER = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Recent Numerical Relativity Papers - arXiv</title>
-    <script>
-    MathJax = {{
-        tex: {{
-            inlineMath: [['$', '$']],
-            displayMath: [['$$', '$$']],
-            processEscapes: true,
-            processEnvironments: true
-        }},
-        options: {{
-            ignoreHtmlClass: 'tex2jax_ignore',
-            processHtmlClass: 'tex2jax_process'
-        }}
-    }};
-    </script>
     <link rel="icon" href="data:,">
-    <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-    <style>
-        :root {{
-            --primary-color: #c16742;
-            --text-color: #533a1c;
-            --background-color: #ede9d0;
-            --card-background: #ede9d0;
-            --border-color: #ede9d0;
-            --muted-text: #533a1c;
-            --secondary-text: #533a1c;
-            --light-background: #ede9d0;
-            --highlight-background: #ede9d0;
-            --button-text: #533a1c;
-            --footer-border: #ede9d0;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            color: var(--text-color);
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: var(--background-color);
-        }}
-        
-        .container {{
-            background: var(--card-background);
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            padding: 30px;
-        }}
-        
-        .header {{
-            margin-bottom: 30px;
-            border-bottom: 2px solid var(--primary-color);
-            padding-bottom: 15px;
-        }}
-        
-        .header h1 {{
-            color: var(--primary-color);
-            margin: 0 0 5px 0;
-            font-size: 2.2em;
-        }}
-        
-        .last-updated {{
-            color: var(--muted-text);
-            font-size: 0.9em;
-        }}
-        
-        .paper {{
-            margin: 3px 0;
-            padding: 6px 0;
-            border-bottom: 1px solid var(--border-color);
-            transition: transform 0.2s ease;
-            display: grid;
-            grid-template-columns: auto 1fr;
-            gap: 15px 15px;
-            row-gap: 0px;
-        }}
-        
-        .paper:hover {{
-            transform: translateY(-1px);
-        }}
-        
-        .paper:last-child {{
-            border-bottom: none;
-        }}
-        
-        .paper-date {{
-            font-size: 0.85em;
-            color: var(--muted-text);
-            font-weight: bold;
-            padding-top: 4px;
-            padding-bottom: 4px;
-            grid-column: 1;
-            grid-row: 1;
-        }}
-        
-        .paper-title {{
-            font-size: 1.2em;
-            font-weight: bold;
-            color: var(--secondary-text);
-            line-height: 1.3;
-            margin-bottom: 0;
-            grid-column: 2;
-            grid-row: 1;
-        }}
-        
-        .paper-title a {{
-            color: var(--primary-color);
-            text-decoration: none;
-        }}
-        
-        .paper-title a:hover {{
-            text-decoration: underline;
-        }}
-        
-        .abstract-section {{
-            grid-column: 1;
-            grid-row: 2;
-        }}
-        
-        .paper-authors {{
-            color: var(--muted-text);
-            font-style: italic;
-            font-size: 0.9em;
-            line-height: 1.4;
-            padding-top: 4px;
-            padding-bottom: 4px;
-            grid-column: 2;
-            grid-row: 2;
-        }}
-        
-        .abstract-toggle {{
-            background: transparent;
-            border: none;
-            border-radius: 4px;
-            padding: 4px 4px;
-            cursor: pointer;
-            user-select: none;
-            font-size: 0.8em;
-            color: var(--button-text);
-            transition: background-color 0.2s ease;
-            display: flex;
-            align-items: center;
-            gap: 4px;
-            flex-shrink: 0;
-            font-style: normal;
-            line-height: 1.4;
-        }}
-        
-        .abstract-toggle:hover {{
-            background: var(--highlight-background);
-        }}
-        
-        .abstract-toggle .arrow {{
-            transition: transform 0.2s ease;
-            font-weight: bold;
-        }}
-        
-        .abstract-toggle.expanded .arrow {{
-            transform: rotate(90deg);
-        }}
-        
-        .paper-abstract {{
-            display: none;
-            text-align: justify;
-            margin: 10px 0 10px 0;
-            line-height: 1.6;
-            padding: 12px;
-            background: var(--highlight-background);
-            border-radius: 4px;
-            border-left: 3px solid var(--primary-color);
-            font-size: 0.9em;
-            grid-column: 1 / -1;
-            grid-row: 3;
-        }}
-        
-        .paper-abstract.show {{
-            display: block;
-        }}
-        
-        .paper-abstract code {{
-            background-color: var(--light-background);
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.85em;
-        }}
-        
-        .paper-abstract a {{
-            color: var(--primary-color);
-            text-decoration: none;
-            border-bottom: 1px dotted var(--primary-color);
-        }}
-        
-        .paper-abstract a:hover {{
-            text-decoration: underline;
-            border-bottom: 1px solid var(--primary-color);
-        }}
-        
-        .paper-abstract [style*="small-caps"], .paper-title [style*="small-caps"] {{
-            font-variant: small-caps;
-            letter-spacing: 0.05em;
-        }}
-        
-        .no-papers {{
-            text-align: center;
-            color: var(--muted-text);
-            font-style: italic;
-            margin: 40px 0;
-            font-size: 1.1em;
-        }}
-        
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid var(--footer-border);
-            color: var(--muted-text);
-            font-size: 0.9em;
-        }}
-        
-        .github-link {{
-            color: var(--primary-color);
-            text-decoration: none;
-        }}
-        
-        .github-link:hover {{
-            text-decoration: underline;
-        }}
-        
-        @media (max-width: 768px) {{
-            body {{
-                padding: 10px;
-            }}
-            
-            .container {{
-                padding: 15px;
-            }}
-            
-            .header {{
-                align-items: flex-start;
-                gap: 10px;
-            }}
-            
-            .header h1 {{
-                font-size: 1.8em;
-            }}
-            
-            .paper {{
-                padding: 15px 0;
-                grid-template-columns: 1fr;
-                gap: 5px;
-            }}
-            
-            .paper-date {{
-                grid-column: 1;
-                grid-row: 1;
-                font-size: 0.8em;
-            }}
-            
-            .paper-title {{
-                grid-column: 1;
-                grid-row: 2;
-            }}
-            
-            .abstract-section {{
-                grid-column: 1;
-                grid-row: 3;
-            }}
-            
-            .paper-authors {{
-                grid-column: 1;
-                grid-row: 4;
-            }}
-            
-            .paper-abstract {{
-                grid-column: 1;
-                grid-row: 5;
-            }}
-            
-            .abstract-toggle {{
-                align-self: flex-start;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="style.css">
+{mathjax}    <script defer src="papers.js"></script>
 </head>
 <body>
     <div class="container">
@@ -589,36 +550,23 @@ def generate_html(papers: list):
         <main>
 """
 
-    if not papers:
-        html_content += """
+# MathJax config and loader, only included in HTML_HEADER when a paper has math
+HTML_MATHJAX = """    <script defer src="mathjax-config.js"></script>
+    <script id="MathJax-script" defer src="https://cdn.jsdelivr.net/npm/mathjax@3.2.2/es5/tex-mml-chtml.js"></script>
+"""
+
+HTML_NO_PAPERS = """
             <div class="no-papers">
                 <p>No recent papers found with "numerical relativity" keywords.</p>
                 <p>Check back later for new submissions!</p>
             </div>
 """
-    else:
-        for paper in papers:
-            # Format publication date
-            pub_date = datetime.fromisoformat(paper['published'].replace('Z', '+00:00'))
-            formatted_date = pub_date.strftime("%d %B %Y")
-            
-            # Format authors (limit to first 5 for display)
-            if len(paper['authors']) > 8:
-                authors_display = (", ".join(
-                    paper['authors'][:NBR_AUTHORS_TO_DISPLAY]) 
-                + f" and {len(paper['authors']) - NBR_AUTHORS_TO_DISPLAY} others")
-            else:
-                authors_display = ", ".join(paper['authors'])
-            
-            # Use full abstract without truncation
-            abstract = process_latex_text(paper['abstract'])
-            title_processed = process_latex_text(paper['title'])
-            
-            html_content += f"""
+
+HTML_PAPER = """
             <article class="paper">
-                <div class="paper-date">{formatted_date}</div>
+                <div class="paper-date">{date}</div>
                 <div class="paper-title">
-                    <a href="https://arxiv.org/abs/{paper['arxiv_id']}" target="_blank" rel="noopener">{title_processed}</a>
+                    <a href="https://arxiv.org/abs/{arxiv_id}" target="_blank" rel="noopener">{title}</a>
                 </div>
                 <div class="abstract-section">
                     <div class="abstract-toggle">
@@ -626,12 +574,12 @@ def generate_html(papers: list):
                         <span>Abstract</span>
                     </div>
                 </div>
-                <div class="paper-authors">{authors_display}</div>
+                <div class="paper-authors">{authors}</div>
                 <div class="paper-abstract">{abstract}</div>
             </article>
 """
 
-    html_content += f"""
+HTML_FOOTER = """
         </main>
         
         <footer class="footer">
@@ -644,44 +592,188 @@ def generate_html(papers: list):
             <p>Data provided by <a href="https://arxiv.org/" target="_blank" rel="noopener" class="github-link">arXiv.org</a></p>
         </footer>
     </div>
-    
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {{
-            const toggles = document.querySelectorAll('.abstract-toggle');
-            toggles.forEach(function(toggle) {{
-                toggle.addEventListener('click', function() {{
-                    this.classList.toggle('expanded');
-                    // Find the abstract element - it's in the same paper container
-                    const paper = this.closest('.paper');
-                    const abstract = paper.querySelector('.paper-abstract');
-                    abstract.classList.toggle('show');
-                    
-                    // Re-render MathJax for the newly shown abstract
-                    if (abstract.classList.contains('show') && window.MathJax) {{
-                        MathJax.typesetPromise([abstract]).catch(function (err) {{
-                            console.log('MathJax typeset failed: ' + err.message);
-                        }});
-                    }}
-                }});
-            }});
-            
-            // Initial MathJax processing for titles that are already visible
-            if (window.MathJax && MathJax.startup && MathJax.startup.promise) {{
-                MathJax.typesetPromise().catch(function (err) {{
-                    console.log('Initial MathJax typeset failed: ' + err.message);
-                }});
-            }}
-        }});
-    </script>
 </body>
 </html>"""
 
-    # Write HTML file
-    with open(HTML_OUTPUT, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+def generate_html(papers: list):
+    """
+    Generate HTML page with the papers.
+    
+    Args:
+        papers: List of dictionary objects
+    """
+    # Get current timestamp
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
+    
+    # Write HTML file, one template chunk at a time. It is written next to the
+    # output and moved into place, so a failed run never leaves a partial page
+    temp_output = HTML_OUTPUT + '.tmp'
+    with open(temp_output, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        # MathJax is only needed for $...$ math or LaTeX environments
+        has_math = any('$' in paper['title'] or '$' in paper['abstract']
+                       or '\\begin{' in paper['abstract'] for paper in papers)
+        f.write(HTML_HEADER.format(timestamp=timestamp,
+                                   mathjax=HTML_MATHJAX if has_math else ''))
+
+        if not papers:
+            f.write(HTML_NO_PAPERS)
+        else:
+            for paper in papers:
+                # Format publication date
+                formatted_date = parse_arxiv_date(paper['published']).strftime("%d %B %Y")
+                
+                # Format authors (limit to first 5 for display)
+                if len(paper['authors']) > 8:
+                    authors_display = (", ".join(
+                        paper['authors'][:NBR_AUTHORS_TO_DISPLAY]) 
+                    + f" and {len(paper['authors']) - NBR_AUTHORS_TO_DISPLAY} others")
+                else:
+                    authors_display = ", ".join(paper['authors'])
+                authors_display = escape(authors_display)
+                
+                # Use full abstract without truncation
+                # Escape &, < and > first; quotes are kept for LaTeX accents like \"a
+                abstract = process_latex_text(escape(paper['abstract'], quote=False))
+                title_processed = process_latex_text(escape(paper['title'], quote=False))
+                
+                f.write(HTML_PAPER.format(
+                    date=formatted_date,
+                    arxiv_id=escape(paper['arxiv_id']),
+                    title=title_processed,
+                    authors=authors_display,
+                    abstract=abstract))
+
+        f.write(HTML_FOOTER)
+    
+    # Keep the existing page if only its timestamp would change
+    if same_page_content(temp_output, HTML_OUTPUT):
+        os.remove(temp_output)
+        print(f"No changes to the HTML page: {HTML_OUTPUT}")
+        return
+    os.replace(temp_output, HTML_OUTPUT)
     
     print(f"HTML file generated: {HTML_OUTPUT}")
 
+LAST_UPDATED_RE = re.compile(r'Last updated: [^<]*')
+
+def same_page_content(new_file: str, old_file: str) -> bool:
+    """
+    Check whether two generated pages match apart from their timestamp.
+    
+    Args:
+        new_file: Path to the newly generated page
+        old_file: Path to the existing page
+        
+    Returns:
+        True if the pages only differ in their "Last updated" time
+    """
+    try:
+        # Compare line by line, stopping at the first real difference
+        with open(new_file, 'r', encoding='utf-8') as new_f, \
+                open(old_file, 'r', encoding='utf-8') as old_f:
+            for new_line, old_line in zip_longest(new_f, old_f):
+                if new_line == old_line:
+                    continue
+                if (new_line is None or old_line is None
+                        or LAST_UPDATED_RE.sub('', new_line) != LAST_UPDATED_RE.sub('', old_line)):
+                    return False
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        print(f"Error comparing HTML pages: {e}")
+        return False
+    return True
+
+# LaTeX-to-HTML substitutions used by process_latex_text, compiled once at
+# import time and applied in order.
+
+# Greek letters - handle these FIRST before accent commands that might interfere
+# Common ones in physics papers (single backslash in the input). One pattern
+# matches every letter, and the name selects the character
+GREEK_LETTERS = {
+    'alpha': 'α', 'beta': 'β', 'gamma': 'γ', 'delta': 'δ', 'epsilon': 'ε', 'zeta': 'ζ',
+    'eta': 'η', 'theta': 'θ', 'iota': 'ι', 'kappa': 'κ', 'lambda': 'λ', 'mu': 'μ',
+    'nu': 'ν', 'xi': 'ξ', 'omicron': 'ο', 'pi': 'π', 'rho': 'ρ', 'sigma': 'σ',
+    'tau': 'τ', 'upsilon': 'υ', 'phi': 'φ', 'chi': 'χ', 'psi': 'ψ', 'omega': 'ω',
+    'Gamma': 'Γ', 'Delta': 'Δ', 'Theta': 'Θ', 'Lambda': 'Λ', 'Xi': 'Ξ', 'Pi': 'Π',
+    'Sigma': 'Σ', 'Upsilon': 'Υ', 'Phi': 'Φ', 'Chi': 'Χ', 'Psi': 'Ψ', 'Omega': 'Ω'
+}
+GREEK_RE = re.compile(r'\\(' + '|'.join(GREEK_LETTERS) + r')\b')
+
+# LaTeX accent commands - handle these AFTER Greek letters
+# One pattern matches every accent, braced (\'{e}) or bare (\'e), and the
+# accent character selects the combining mark. Braced arguments are matched
+# innermost first, so nested accents such as \'{\"a} need repeated passes
+ACCENT_RE = re.compile(r"\\(['`^\"~=uvc])(?:\{([^{}]+)\}|([a-zA-Z]))")
+ACCENT_MARKS = {
+    "'": '\u0301',  # acute accent
+    '`': '\u0300',  # grave accent
+    '^': '\u0302',  # circumflex
+    '"': '\u0308',  # diaeresis
+    '~': '\u0303',  # tilde
+    '=': '\u0304',  # macron
+    'u': '\u0306',  # breve
+    'v': '\u030C',  # caron
+    'c': '\u0327',  # cedilla
+}
+MARK_ORDER = list(ACCENT_MARKS.values())
+
+def replace_accent(match):
+    """Replace a LaTeX accent match with the letter and its combining mark."""
+    letters = match.group(2) if match.group(2) is not None else match.group(3)
+    # Stacked marks are kept in ACCENT_MARKS order, so \`{\^{o}} and \^{\`{o}} match
+    base = letters.rstrip(''.join(MARK_ORDER))
+    marks = sorted(letters[len(base):] + ACCENT_MARKS[match.group(1)], key=MARK_ORDER.index)
+    return base + ''.join(marks)
+
+# Math expressions containing \texttt{}, and the \texttt{} inside them
+MATH_TEXTTT_RE = re.compile(r'\$[^$]*\\texttt\{[^}]*\}[^$]*\$')
+TEXTTT_RE = re.compile(r'\\texttt\{([^}]+)\}')
+
+# LaTeX text formatting commands, e.g. \emph{text} -> <em>text</em>
+# (\texttt{} is only converted to <code> outside math mode).
+# The argument may hold one level of braces, e.g. \textbf{$\mathcal{M}$};
+# nested commands are converted over repeated passes, deeper braces are left as is
+FORMAT_RE = re.compile(r'\\(emph|textbf|textit|textsc|texttt|textrm)\{((?:[^{}]|\{[^{}]*\})+)\}')
+FORMAT_TAGS = {
+    'emph': ('<em>', '</em>'),
+    'textbf': ('<strong>', '</strong>'),
+    'textit': ('<em>', '</em>'),
+    'textsc': ('<span style="font-variant: small-caps;">', '</span>'),
+    'texttt': ('<code>', '</code>'),
+    'textrm': ('<span style="font-style: normal;">', '</span>'),
+}
+
+def replace_format(match):
+    """Replace a LaTeX formatting command match with the matching HTML tags."""
+    open_tag, close_tag = FORMAT_TAGS[match.group(1)]
+    return open_tag + match.group(2) + close_tag
+
+def sub_repeatedly(pattern, repl, text):
+    """
+    Apply a substitution repeatedly until nothing is left to replace.
+    
+    Args:
+        pattern: Compiled regex matching a command and its argument
+        repl: Replacement function for each match
+        text: Text to transform
+        
+    Returns:
+        Text with all (possibly nested) matches replaced
+    """
+    nbr_subs = 1
+    while nbr_subs:
+        text, nbr_subs = pattern.subn(repl, text)
+    return text
+
+# http/https URLs, avoiding those already inside HTML tags
+# and stopping at escaped angle brackets (&lt;URL&gt;)
+URL_RE = re.compile(r'(?<!href=")(?<!href=\')(?<!src=")(?<!src=\')(https?://(?:(?!&lt;|&gt;)[^\s<>"\'()])+)')
+
+# Math delimiters around HTML tags: $<tag>content</tag>$ and $<code>text</code>$
+MATH_HTML_RE = re.compile(r'\$(<[^>]+>[^<]*</[^>]+>)\$')
+MATH_CODE_RE = re.compile(r'\$<code>([^<]*)</code>\$')
+
 def process_latex_text(text: str) -> str:
     """
     Convert LaTeX text commands to HTML.
@@ -693,146 +785,129 @@ def process_latex_text(text: str) -> str:
         Text with LaTeX commands converted to HTML
     """
     
-    # Greek letters - handle these FIRST before accent commands that might interfere
-    # Common ones in physics papers (single backslash in the input)
-    greek_map = {
-        r'\\alpha\b': 'α', r'\\beta\b': 'β', r'\\gamma\b': 'γ', r'\\delta\b': 'δ',
-        r'\\epsilon\b': 'ε', r'\\zeta\b': 'ζ', r'\\eta\b': 'η', r'\\theta\b': 'θ',
-        r'\\iota\b': 'ι', r'\\kappa\b': 'κ', r'\\lambda\b': 'λ', r'\\mu\b': 'μ',
-        r'\\nu\b': 'ν', r'\\xi\b': 'ξ', r'\\omicron\b': 'ο', r'\\pi\b': 'π',
-        r'\\rho\b': 'ρ', r'\\sigma\b': 'σ', r'\\tau\b': 'τ', r'\\upsilon\b': 'υ',
-        r'\\phi\b': 'φ', r'\\chi\b': 'χ', r'\\psi\b': 'ψ', r'\\omega\b': 'ω',
-        r'\\Gamma\b': 'Γ', r'\\Delta\b': 'Δ', r'\\Theta\b': 'Θ', r'\\Lambda\b': 'Λ',
-        r'\\Xi\b': 'Ξ', r'\\Pi\b': 'Π', r'\\Sigma\b': 'Σ', r'\\Upsilon\b': 'Υ',
-        r'\\Phi\b': 'Φ', r'\\Chi\b': 'Χ', r'\\Psi\b': 'Ψ', r'\\Omega\b': 'Ω'
-    }
-    
-    # Apply Greek letter transformations FIRST
-    for latex_cmd, unicode_char in greek_map.items():
-        text = re.sub(latex_cmd, unicode_char, text)
-    
-    # LaTeX accent commands - handle these AFTER Greek letters
-    accent_map = {
-        r"\\'\{([^}]+)\}": lambda m: m.group(1) + '\u0301',  # acute accent combining
-        r"\\'([a-zA-Z])": lambda m: m.group(1) + '\u0301',    # acute accent \'a
-        r"\\`\{([^}]+)\}": lambda m: m.group(1) + '\u0300',  # grave accent combining
-        r"\\`([a-zA-Z])": lambda m: m.group(1) + '\u0300',    # grave accent \`a
-        r'\\\^\{([^}]+)\}': lambda m: m.group(1) + '\u0302',  # circumflex combining
-        r'\\\^([a-zA-Z])': lambda m: m.group(1) + '\u0302',   # circumflex \^a
-        r'\\"\{([^}]+)\}': lambda m: m.group(1) + '\u0308',   # diaeresis combining
-        r'\\"([a-zA-Z])': lambda m: m.group(1) + '\u0308',    # diaeresis \"a
-        r'\\~\{([^}]+)\}': lambda m: m.group(1) + '\u0303',   # tilde combining
-        r'\\~([a-zA-Z])': lambda m: m.group(1) + '\u0303',    # tilde \~a
-        r'\\=\{([^}]+)\}': lambda m: m.group(1) + '\u0304',   # macron combining
-        r'\\=([a-zA-Z])': lambda m: m.group(1) + '\u0304',    # macron \=a
-        r'\\u\{([^}]+)\}': lambda m: m.group(1) + '\u0306',   # breve combining
-        r'\\u([a-zA-Z])': lambda m: m.group(1) + '\u0306',    # breve \u{a}
-        r'\\v\{([^}]+)\}': lambda m: m.group(1) + '\u030C',   # caron combining
-        r'\\v([a-zA-Z])': lambda m: m.group(1) + '\u030C',    # caron \v{a}
-        r'\\c\{([^}]+)\}': lambda m: m.group(1) + '\u0327',   # cedilla combining
-        r'\\c([a-zA-Z])': lambda m: m.group(1) + '\u0327',    # cedilla \c{c}
-    }
-    
-    # Apply accent transformations
-    for pattern, replacement in accent_map.items():
-        text = re.sub(pattern, replacement, text)
-    
-    # Handle \texttt{} inside math mode first (before general \texttt processing)
-    # \texttt{} in math mode should become \text{} or \mathrm{} for MathJax
-    def replace_texttt_in_math(match):
-        full_math = match.group(0)
-        # Replace \texttt{content} with \text{content} inside this math expression
-        fixed_math = re.sub(r'\\texttt\{([^}]+)\}', r'\\text{\1}', full_math)
-        return fixed_math
-    
-    # Find all math expressions and fix \texttt inside them
-    text = re.sub(r'\$[^$]*\\texttt\{[^}]*\}[^$]*\$', replace_texttt_in_math, text)
-    
-    # Handle escaped underscore
-    text = re.sub(r'\\_', '_', text)
-    text = re.sub(r'\\%', '%', text)
-    
-    # Apply all LaTeX text formatting transformations
-    # \emph{text} -> <em>text</em>
-    text = re.sub(r'\\emph\{([^}]+)\}', r'<em>\1</em>', text)
-    
-    # \textbf{text} -> <strong>text</strong>
-    text = re.sub(r'\\textbf\{([^}]+)\}', r'<strong>\1</strong>', text)
-    
-    # \textit{text} -> <em>text</em>
-    text = re.sub(r'\\textit\{([^}]+)\}', r'<em>\1</em>', text)
-    
-    # \textsc{text} -> <span style="font-variant: small-caps;">text</span>
-    text = re.sub(r'\\textsc\{([^}]+)\}', r'<span style="font-variant: small-caps;">\1</span>', text)
-    
-    # \texttt{text} -> <code>text</code> (only for text outside math mode now)
-    text = re.sub(r'\\texttt\{([^}]+)\}', r'<code>\1</code>', text)
-    
-    # \textrm{text} -> <span style="font-style: normal;">text</span>
-    text = re.sub(r'\\textrm\{([^}]+)\}', r'<span style="font-style: normal;">\1</span>', text)
+    # Nothing to convert in plain text (no commands, math, URLs or corrupted characters)
+    if '\\' not in text and '$' not in text and 'http' not in text and 'ḩ' not in text:
+        return text
+    
+    # LaTeX commands all start with a backslash
+    if '\\' in text:
+        # Apply Greek letter transformations FIRST
+        text = GREEK_RE.sub(lambda m: GREEK_LETTERS[m.group(1)], text)
+        
+        # Apply accent transformations
+        text = sub_repeatedly(ACCENT_RE, replace_accent, text)
+        
+        # Handle \texttt{} inside math mode first (before general \texttt processing)
+        # \texttt{} in math mode should become \text{} or \mathrm{} for MathJax
+        def replace_texttt_in_math(match):
+            full_math = match.group(0)
+            # Replace \texttt{content} with \text{content} inside this math expression
+            fixed_math = TEXTTT_RE.sub(r'\\text{\1}', full_math)
+            return fixed_math
+        
+        # Find all math expressions and fix \texttt inside them
+        if '$' in text:
+            text = MATH_TEXTTT_RE.sub(replace_texttt_in_math, text)
+        
+        # Handle escaped underscore
+        text = text.replace('\\_', '_')
+        text = text.replace('\\%', '%')
+        
+        # Apply all LaTeX text formatting transformations
+        if '\\text' in text or '\\emph' in text:
+            text = sub_repeatedly(FORMAT_RE, replace_format, text)
     
     # Fix corrupted characters that appear in arXiv data
     # Handle cases where character encoding went wrong
-    text = re.sub(r'ḩi', 'χ', text)  # Corrupted chi character (U+1E29 + i -> χ)
-    text = re.sub(r'ḩ', 'χ', text)   # General fix for this corruption (U+1E29 -> χ)
+    if 'ḩ' in text:
+        text = text.replace('ḩi', 'χ')  # Corrupted chi character (U+1E29 + i -> χ)
+        text = text.replace('ḩ', 'χ')   # General fix for this corruption (U+1E29 -> χ)
     
     # Make URLs clickable - detect http/https URLs and convert to links
-    # This pattern matches URLs but avoids matching those already inside HTML tags
-    url_pattern = r'(?<!href=")(?<!href=\')(?<!src=")(?<!src=\')(https?://[^\s<>"\'()]+)'
-    text = re.sub(url_pattern, r'<a href="\1" target="_blank" rel="noopener">\1</a>', text)
-    
-    # Fix math delimiters around HTML tags (this causes MathJax rendering issues)
-    # Pattern: $<tag>content</tag>$ -> <tag>content</tag>
-    text = re.sub(r'\$(<[^>]+>[^<]*</[^>]+>)\$', r'\1', text)
+    if 'http' in text:
+        text = URL_RE.sub(r'<a href="\1" target="_blank" rel="noopener">\1</a>', text)
     
-    # Also handle cases where \texttt{} was used inside math mode
-    # This pattern catches $\texttt{text}$ which becomes $<code>text</code>$ after \texttt processing
-    # We convert it to just <code>text</code> (remove the math delimiters)
-    text = re.sub(r'\$<code>([^<]*)</code>\$', r'<code>\1</code>', text)
+    if '$' in text:
+        # Fix math delimiters around HTML tags (this causes MathJax rendering issues)
+        # Pattern: $<tag>content</tag>$ -> <tag>content</tag>
+        text = MATH_HTML_RE.sub(r'\1', text)
+        
+        # Also handle cases where \texttt{} was used inside math mode
+        # This pattern catches $\texttt{text}$ which becomes $<code>text</code>$ after \texttt processing
+        # We convert it to just <code>text</code> (remove the math delimiters)
+        text = MATH_CODE_RE.sub(r'<code>\1</code>', text)
     
     return text
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(
-        description='Scrape arXiv for papers with keywords and generate an HTML page')
-    parser.add_argument('--query', default='numerical relativity', 
-                       help='Search query (default: "numerical relativity")')
-    parser.add_argument('--days-back', type=int, default=60,
-                       help='How many days back to search (default: 60)')
-    parser.add_argument('--target-authors', nargs='*', default=TARGET_AUTHORS,
-        help='List of author names to always include (default: a couple UKNR authors)')
-    args = parser.parse_args()
-
+def main(query: str | list = 'numerical relativity', days_back: int = 60,
+         target_authors: list = None, cache_ttl: int = None) -> list:
+    """
+    Fetch new papers, update the papers database and regenerate the HTML page.
+    
+    Args:
+        query: Search query string, or a list of them to match any of
+        days_back: How many days back to search, and to keep papers for
+        target_authors: List of author names to always include (default: TARGET_AUTHORS)
+        cache_ttl: Seconds to reuse cached arXiv results, 0 to disable the cache
+            (default: QUERY_CACHE_TTL)
+        
+    Returns:
+        List of dictionary objects in the updated database
+    """
+    global QUERY_CACHE_TTL
+    if target_authors is None:
+        target_authors = TARGET_AUTHORS
+    if cache_ttl is not None:
+        QUERY_CACHE_TTL = cache_ttl
+    
     # Search arXiv for new papers
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("Fetching new papers from arXiv...")
-    new_papers = search_arxiv(args.query, args.days_back, args.target_authors)
+    new_papers = search_arxiv(query, days_back, target_authors)
 
     # Load existing papers from database
-    print("=" * 60)
+    print(SEPARATOR)
     print("Loading papers database...")
     existing_papers = load_papers_database()
 
     # Merge new papers with existing ones
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("Merging papers...")
     merged_papers = merge_papers(existing_papers, new_papers)
 
     # Prune old papers
-    print("\n" + "=" * 60)
-    print(f"Pruning papers older than {args.days_back} days...")
-    final_papers = prune_old_papers(merged_papers, args.days_back)
+    print("\n" + SEPARATOR)
+    print(f"Pruning papers older than {days_back} days...")
+    final_papers = prune_old_papers(merged_papers, days_back)
 
     # Save updated database
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("Saving database...")
-    save_papers_database(final_papers)
+    if final_papers == existing_papers:
+        print("No changes to the papers database")
+    else:
+        save_papers_database(final_papers)
 
     # Generate HTML
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print("Generating HTML...")
     generate_html(final_papers)
 
-    print("\n" + "=" * 60)
+    print("\n" + SEPARATOR)
     print(f"Done! Database contains {len(final_papers)} papers (generated {HTML_OUTPUT})")
-    print("=" * 60)
+    print(SEPARATOR)
+    return final_papers
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='Scrape arXiv for papers with keywords and generate an HTML page')
+    parser.add_argument('--query', nargs='+', default=['numerical relativity'],
+                       help='Search queries, papers matching any are kept (default: "numerical relativity")')
+    parser.add_argument('--days-back', type=int, default=60,
+                       help='How many days back to search (default: 60)')
+    parser.add_argument('--target-authors', nargs='*', default=TARGET_AUTHORS,
+        help='List of author names to always include (default: a couple UKNR authors)')
+    parser.add_argument('--cache-ttl', type=int, default=QUERY_CACHE_TTL,
+                       help=f'Seconds to reuse cached arXiv results, 0 to always fetch and disable the cache (default: {QUERY_CACHE_TTL})')
+    args = parser.parse_args()
+    main(args.query, args.days_back, args.target_authors, args.cache_ttl)
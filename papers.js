@@ -0,0 +1,26 @@
+document.addEventListener('DOMContentLoaded', function() {
+    const toggles = document.querySelectorAll('.abstract-toggle');
+    toggles.forEach(function(toggle) {
+        toggle.addEventListener('click', function() {
+            this.classList.toggle('expanded');
+            // Find the abstract element - it's in the same paper container
+            const paper = this.closest('.paper');
+            const abstract = paper.querySelector('.paper-abstract');
+            abstract.classList.toggle('show');
+
+            // Re-render MathJax for the newly shown abstract
+            if (abstract.classList.contains('show') && window.MathJax) {
+                MathJax.typesetPromise([abstract]).catch(function (err) {
+                    console.log('MathJax typeset failed: ' + err.message);
+                });
+            }
+        });
+    });
+
+    // Initial MathJax processing for titles that are already visible
+    if (window.MathJax && MathJax.startup && MathJax.startup.promise) {
+        MathJax.typesetPromise().catch(function (err) {
+            console.log('Initial MathJax typeset failed: ' + err.message);
+        });
+    }
+});